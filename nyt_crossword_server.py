@@ -1,20 +1,45 @@
-from typing import Any, Dict
+from typing import Any, Dict, NamedTuple
 
+import aiosqlite
+import asyncio
 import httpx
+import ijson
+import orjson
 import os
-from datetime import datetime, timedelta
+import random
+from operator import attrgetter
+import time
+from contextlib import asynccontextmanager
+from datetime import date as date_cls, datetime, timedelta
 import logging
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-mcp = FastMCP("nyt-crossword")
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Close the shared HTTP client and the stats database on shutdown.
+
+    Runs inside the server's own event loop, which is the loop those
+    resources were created on; the closes are gathered independently so
+    one failing can't skip the other.
+    """
+    try:
+        yield
+    finally:
+        results = await asyncio.gather(close_client(), close_db(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Shutdown cleanup failed: %s", result)
+
+mcp = FastMCP("nyt-crossword", lifespan=_lifespan)
 
 NYT_API_BASE = "https://www.nytimes.com/svc/crosswords"
-PUZZLE_INFO_ENDPOINT = "/v3/36569100/puzzles.json?publish_type=daily&date_start={start_date}&date_end={end_date}"
-PUZZLE_STATS_ENDPOINT = "/v6/game/{id}.json"
+PUZZLE_INFO_ENDPOINT = "/v3/36569100/puzzles.json?publish_type=daily&date_start={}&date_end={}"
 USER_AGENT = "scraping personal stats"
+STATS_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzle_stats_cache.db")
 
 class Config:
     def __init__(self):
@@ -26,66 +51,432 @@ class Config:
 
 config = Config()
 
+_BASE_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json",
+    "DNT": "1"
+}
+
+# Shared client so all requests reuse pooled keep-alive connections and
+# HTTP/2 multiplexing instead of paying a TCP+TLS handshake per call.
+_client: httpx.AsyncClient | None = None
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    The cookie never changes after startup, so all headers are set once
+    on the client rather than rebuilt per request.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=NYT_API_BASE,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            headers={**_BASE_HEADERS, "Cookie": config.nyt_cookie}
+        )
+    return _client
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+# On-disk cache so historical stats survive server restarts. The server is
+# re-spawned by MCP clients frequently, so without this every session would
+# re-fetch the same immutable past days from NYT.
+_db: aiosqlite.Connection | None = None
+_db_lock = asyncio.Lock()
+
+async def get_db() -> aiosqlite.Connection:
+    """Get the on-disk stats cache connection, creating it on first use.
+
+    The lock keeps the stats fan-out from racing the lazy init and
+    opening one connection (and its worker thread) per task; _db is only
+    assigned once the schema is ready.
+    """
+    global _db
+    if _db is None:
+        async with _db_lock:
+            if _db is None:
+                db = await aiosqlite.connect(STATS_DB_PATH)
+                await db.execute(
+                    "CREATE TABLE IF NOT EXISTS puzzle_stats ("
+                    "puzzle_id INTEGER PRIMARY KEY, fetched_at INTEGER, json TEXT)"
+                )
+                await db.execute(
+                    "CREATE TABLE IF NOT EXISTS puzzle_ids ("
+                    "print_date TEXT PRIMARY KEY, puzzle_id INTEGER)"
+                )
+                await db.commit()
+                _db = db
+    return _db
+
+async def close_db() -> None:
+    """Close the on-disk stats cache if it was opened."""
+    global _db
+    if _db is not None:
+        await _db.close()
+        _db = None
+
+async def load_persisted_stats(puzzle_id: int) -> Dict[str, Any] | None:
+    """Load stats for a puzzle from the on-disk cache, if present."""
+    try:
+        db = await get_db()
+        async with db.execute(
+            "SELECT json FROM puzzle_stats WHERE puzzle_id = ?", (puzzle_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        return orjson.loads(row[0]) if row else None
+    except Exception as e:
+        logger.error("Failed to read stats cache for puzzle %s: %s", puzzle_id, e)
+        return None
+
+async def persist_stats(puzzle_id: int, stats: Dict[str, Any]) -> None:
+    """Write stats for a puzzle to the on-disk cache."""
+    try:
+        db = await get_db()
+        await db.execute(
+            "INSERT OR REPLACE INTO puzzle_stats (puzzle_id, fetched_at, json) VALUES (?, ?, ?)",
+            (puzzle_id, int(time.time()), orjson.dumps(stats))
+        )
+        await db.commit()
+    except Exception as e:
+        logger.error("Failed to write stats cache for puzzle %s: %s", puzzle_id, e)
+
+async def load_persisted_puzzle_id(print_date: str) -> int | None:
+    """Look up a date's puzzle ID in the on-disk cache, if present."""
+    try:
+        db = await get_db()
+        async with db.execute(
+            "SELECT puzzle_id FROM puzzle_ids WHERE print_date = ?", (print_date,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logger.error("Failed to read puzzle ID cache for %s: %s", print_date, e)
+        return None
+
+async def persist_puzzle_ids(puzzle_map: Dict[str, int]) -> None:
+    """Write a date-to-puzzle-ID mapping to the on-disk cache."""
+    try:
+        db = await get_db()
+        await db.executemany(
+            "INSERT OR REPLACE INTO puzzle_ids (print_date, puzzle_id) VALUES (?, ?)",
+            puzzle_map.items()
+        )
+        await db.commit()
+    except Exception as e:
+        logger.error("Failed to write puzzle ID cache: %s", e)
+
+# Retry policy for transient failures: rate limits and server errors get a
+# few attempts with exponential backoff plus jitter so the parallel fan-out
+# doesn't hammer NYT in lockstep when it pushes back.
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_MAX_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5
+
+def _retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Compute the backoff before the next attempt, honoring Retry-After."""
+    delay = _RETRY_BASE_DELAY * 2 ** attempt + random.random() * 0.25
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
+
 async def make_nyt_request(endpoint: str) -> Dict[str, Any] | None:
     """Make a request to the NYT Games API"""
     if not config.nyt_cookie:
         logger.error("NYT cookie not configured")
         return None
-        
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "application/json",
-        "Cookie": config.nyt_cookie,
-        "DNT": "1"
-    }
-    
+
     url = f"{NYT_API_BASE}{endpoint}"
-    
-    async with httpx.AsyncClient() as client:
+
+    for attempt in range(_MAX_ATTEMPTS):
         try:
-            response = await client.get(url, headers=headers, timeout=30.0)
+            response = await get_client().get(endpoint)
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes directly, skipping the utf-8 decode
+            # pass that response.json() would do via response.text
+            return orjson.loads(await response.aread())
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code} for {url}")
+            status = e.response.status_code
+            if status in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS - 1:
+                delay = _retry_delay(attempt, e.response)
+                logger.warning("HTTP error %s for %s, retrying in %.1fs", status, url, delay)
+                await asyncio.sleep(delay)
+                continue
+            logger.error("HTTP error %s for %s", status, url)
             return None
         except Exception as e:
-            logger.error(f"Request failed for {url}: {str(e)}")
+            logger.error("Request failed for %s: %s", url, e)
             return None
 
+    return None
+
+# Stats for past days are immutable once solved, so they can be cached far
+# longer than today's puzzle, which may still be in progress. Both caches
+# store in-flight tasks rather than results so concurrent callers for the
+# same puzzle coalesce into a single request.
+_stats_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_historical_stats_cache: TTLCache = TTLCache(maxsize=4096, ttl=30 * 24 * 3600)
+_puzzle_listing_cache: TTLCache = TTLCache(maxsize=64, ttl=300)
+
+def _evict_on_failure(cache: TTLCache, key: Any):
+    """Done-callback that drops a cancelled or failed task from a cache.
+
+    Without this, a task cancelled mid-flight (e.g. by a client
+    disconnect) would sit in the cache until its TTL expired and every
+    caller reusing it would see the same CancelledError.
+    """
+    def _evict(task: asyncio.Future) -> None:
+        if (task.cancelled() or task.exception() is not None) and cache.get(key) is task:
+            cache.pop(key, None)
+    return _evict
+
+# Listing fields worth keeping per entry: the puzzle ID plus any progress
+# hints that let us skip the stats fetch for clearly untouched puzzles
+_LISTING_FIELDS = ('puzzle_id', 'percent_filled', 'solved')
+
+async def _fetch_puzzle_listing(start_date: str, end_date: str) -> Dict[str, Dict[str, Any]] | None:
+    """Fetch the puzzle listing for a date range from the NYT API.
+
+    The listing response carries many fields per puzzle that we never
+    look at, so stream-parse it with ijson: only one entry is
+    materialized at a time and the full payload is never buffered.
+    """
+    if not config.nyt_cookie:
+        logger.error("NYT cookie not configured")
+        return None
+
+    endpoint = PUZZLE_INFO_ENDPOINT.format(start_date, end_date)
+    url = f"{NYT_API_BASE}{endpoint}"
+
+    for attempt in range(_MAX_ATTEMPTS):
+        # Create a mapping of date strings to the listing fields we keep
+        listing = {}
+
+        try:
+            async with get_client().stream("GET", endpoint) as response:
+                response.raise_for_status()
+                puzzles = ijson.sendable_list()
+                parser = ijson.items_coro(puzzles, 'results.item')
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for puzzle in puzzles:
+                        if 'print_date' in puzzle and 'puzzle_id' in puzzle:
+                            listing[puzzle['print_date']] = {
+                                field: puzzle[field]
+                                for field in _LISTING_FIELDS if field in puzzle
+                            }
+                    del puzzles[:]
+                parser.close()
+            return listing
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS - 1:
+                delay = _retry_delay(attempt, e.response)
+                logger.warning("HTTP error %s for %s, retrying in %.1fs", status, url, delay)
+                await asyncio.sleep(delay)
+                continue
+            logger.error("HTTP error %s for %s", status, url)
+            return None
+        except Exception as e:
+            logger.error("Request failed for %s: %s", url, e)
+            return None
+
+    return None
+
+async def get_puzzle_listing(start_date: str, end_date: str) -> Dict[str, Dict[str, Any]] | None:
+    """Get the puzzle listing for a date range, caching recent lookups briefly."""
+    key = (start_date, end_date)
+    task = _puzzle_listing_cache.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_puzzle_listing(start_date, end_date))
+        task.add_done_callback(_evict_on_failure(_puzzle_listing_cache, key))
+        _puzzle_listing_cache[key] = task
+
+    listing = await task
+    if listing is None:
+        # Don't cache failures
+        _puzzle_listing_cache.pop(key, None)
+    return listing
+
 async def get_puzzle_ids(start_date: str, end_date: str) -> Dict[str, int] | None:
     """Get puzzle IDs for a date range."""
-    endpoint = PUZZLE_INFO_ENDPOINT.format(start_date=start_date, end_date=end_date)
-    data = await make_nyt_request(endpoint)
-    
-    if not data or 'results' not in data:
+    listing = await get_puzzle_listing(start_date, end_date)
+    if listing is None:
         return None
-    
-    # Create a mapping of date strings to puzzle IDs
-    puzzle_map = {}
-    for puzzle in data['results']:
-        if 'print_date' in puzzle and 'puzzle_id' in puzzle:
-            puzzle_map[puzzle['print_date']] = puzzle['puzzle_id']
-    
-    return puzzle_map
+    return {date_str: entry['puzzle_id'] for date_str, entry in listing.items()}
+
+def _maybe_solved(entry: Dict[str, Any]) -> bool:
+    """Whether a listing entry could represent a solved puzzle.
+
+    Untouched puzzles can be ruled out from the listing alone, saving a
+    stats request each. If the listing carries no progress hint, assume
+    the puzzle may be solved and fetch its stats.
+    """
+    if entry.get('solved'):
+        return True
+    if 'percent_filled' in entry:
+        return entry['percent_filled'] > 0
+    return 'solved' not in entry
+
+async def lookup_puzzle_id(print_date: str) -> int | None:
+    """Resolve a single date to its puzzle ID.
+
+    Date-to-ID mappings never change, so consult the on-disk cache
+    first. On a miss, fetch a month-long window in one listing call and
+    persist it, so lookups for neighboring dates skip the network too.
+    """
+    puzzle_id = await load_persisted_puzzle_id(print_date)
+    if puzzle_id is not None:
+        return puzzle_id
+
+    window_end = (date_cls.fromisoformat(print_date) + timedelta(days=30)).isoformat()
+    puzzle_ids = await get_puzzle_ids(print_date, window_end)
+    if not puzzle_ids:
+        return None
+
+    await persist_puzzle_ids(puzzle_ids)
+    return puzzle_ids.get(print_date)
+
+# Cap concurrent stats fetches so the parallel fan-out doesn't trip NYT rate limits
+_stats_semaphore = asyncio.Semaphore(10)
+
+async def _fetch_puzzle_solve_stats(puzzle_id: int) -> Dict[str, Any] | None:
+    """Fetch solve statistics for a puzzle ID from the NYT API."""
+    endpoint = f"/v6/game/{puzzle_id}.json"
+    async with _stats_semaphore:
+        return await make_nyt_request(endpoint)
+
+async def _load_or_fetch_stats(puzzle_id: int, historical: bool) -> Dict[str, Any] | None:
+    """Load stats from the on-disk cache for past days, else fetch from NYT.
+
+    Only solved stats are immutable — an unsolved past puzzle can still
+    be solved later — so only solved stats are persisted or trusted from
+    disk.
+    """
+    if historical:
+        stats = await load_persisted_stats(puzzle_id)
+        if stats is not None and stats.get('calcs', {}).get('solved'):
+            return stats
+
+    stats = await _fetch_puzzle_solve_stats(puzzle_id)
+    if historical and stats is not None and stats.get('calcs', {}).get('solved'):
+        await persist_stats(puzzle_id, stats)
+    return stats
 
-async def get_puzzle_solve_stats(puzzle_id: int) -> Dict[str, Any] | None:
-    """Get solve statistics for a specific puzzle ID."""
-    endpoint = PUZZLE_STATS_ENDPOINT.format(id=puzzle_id)
-    return await make_nyt_request(endpoint)
+async def get_puzzle_solve_stats(puzzle_id: int, date_str: str | None = None) -> Dict[str, Any] | None:
+    """Get solve statistics for a specific puzzle ID.
+
+    Results are cached; pass the puzzle's print date so stats for past
+    days (immutable once solved) can be kept much longer than today's.
+    """
+    task = _historical_stats_cache.get(puzzle_id) or _stats_cache.get(puzzle_id)
+    if task is None:
+        historical = bool(date_str and date_str < date_cls.today().isoformat())
+        cache = _historical_stats_cache if historical else _stats_cache
+        task = asyncio.ensure_future(_load_or_fetch_stats(puzzle_id, historical))
+        task.add_done_callback(_evict_on_failure(cache, puzzle_id))
+        cache[puzzle_id] = task
+
+    stats = await task
+    if stats is None:
+        # Don't cache failures
+        _stats_cache.pop(puzzle_id, None)
+        _historical_stats_cache.pop(puzzle_id, None)
+    elif puzzle_id in _historical_stats_cache and not stats.get('calcs', {}).get('solved'):
+        # Unsolved past puzzles aren't immutable; keep them on the short TTL
+        _historical_stats_cache.pop(puzzle_id, None)
+        _stats_cache[puzzle_id] = task
+    return stats
+
+async def fetch_all_solve_stats(puzzle_ids: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+    """Fetch solve stats for all puzzles concurrently.
+
+    The NYT API has no bulk stats endpoint, so this issues one request
+    per puzzle — but all of them go out together as multiplexed HTTP/2
+    streams on the shared client's connection, costing roughly one round
+    trip for the whole batch rather than one per puzzle.
+
+    Returns a mapping of date string to stats for puzzles that fetched
+    successfully; failed or errored fetches are dropped.
+    """
+    results = await asyncio.gather(
+        *(get_puzzle_solve_stats(puzzle_id, date_str)
+          for date_str, puzzle_id in puzzle_ids.items()),
+        return_exceptions=True
+    )
+
+    stats_by_date = {}
+    for date_str, result in zip(puzzle_ids.keys(), results):
+        if isinstance(result, BaseException):
+            logger.error("Stats fetch failed for %s: %s", date_str, result)
+        elif result:
+            stats_by_date[date_str] = result
+
+    return stats_by_date
+
+# A puzzle counts as hint-assisted if any square was ever checked or revealed
+_CHEAT_KEYS = frozenset(('checked', 'revealed'))
+
+class Solve(NamedTuple):
+    """One solved puzzle, as consumed by the formatting helpers."""
+    date: str
+    solve_time: int
+    cheated: bool
+
+async def _load_solves(days: int) -> tuple[int, list[Solve]] | None:
+    """Fetch and parse solved puzzles for the last `days` days.
+
+    Shared by the tools below so a dashboard call (or back-to-back tool
+    calls, via the caches) fetches and parses each puzzle only once.
+    Returns the number of available puzzles and one record per solved
+    puzzle, or None if the listing could not be fetched.
+    """
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+
+    listing = await get_puzzle_listing(start_date.date().isoformat(), end_date.date().isoformat())
+    if not listing:
+        return None
+
+    # Only fan out stats requests for puzzles the listing says were
+    # touched at all; clearly untouched ones can't contribute solves
+    puzzle_ids = {
+        date_str: entry['puzzle_id']
+        for date_str, entry in listing.items() if _maybe_solved(entry)
+    }
+
+    solves = []
+    stats_by_date = await fetch_all_solve_stats(puzzle_ids)
+    for date_str, puzzle_stats in stats_by_date.items():
+        calcs = puzzle_stats.get('calcs', {})
+        if calcs.get('solved'):
+            solve_time = calcs.get('secondsSpentSolving', 0)
+            firsts = puzzle_stats.get('firsts', {})
+            cheated = not _CHEAT_KEYS.isdisjoint(firsts)
+
+            solves.append(Solve(date_str, solve_time, cheated))
+
+    return len(listing), solves
 
 def format_solve_time(seconds: int) -> str:
     """Format solve time in seconds to readable format."""
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        remaining_seconds = seconds % 60
-        return f"{minutes}m {remaining_seconds}s"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
         return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
 
 def format_puzzle_info(puzzle_data: Dict[str, Any]) -> str:
     """Format puzzle information into a readable string."""
@@ -108,75 +499,86 @@ Solve Time: {format_solve_time(solve_time) if solve_time else 'Not solved'}
     return result.strip()
 
 
+def _format_stats(days: int, total_puzzles: int, solves: list[Solve]) -> str:
+    """Format summary statistics for a list of solve records."""
+    # Accumulate all the aggregates in one pass over the solves
+    # instead of building intermediate lists and re-scanning them
+    total_solved = len(solves)
+    timed_count = 0
+    total_time = 0
+    fastest_time = 0
+    slowest_time = 0
+    cheated_count = 0
+
+    for solve in solves:
+        if solve.cheated:
+            cheated_count += 1
+
+        solve_time = solve.solve_time
+        if solve_time > 0:
+            timed_count += 1
+            total_time += solve_time
+            if not fastest_time or solve_time < fastest_time:
+                fastest_time = solve_time
+            if solve_time > slowest_time:
+                slowest_time = solve_time
+
+    avg_time = total_time // timed_count if timed_count else 0
+
+    result = f"""
+Your NYT Crossword Statistics (Last {days} days):
+
+Puzzles Available: {total_puzzles}
+Puzzles Solved: {total_solved}
+Solve Rate: {(total_solved/total_puzzles*100):.1f}%
+Average Solve Time: {format_solve_time(avg_time) if avg_time else 'N/A'}
+Fastest Solve: {format_solve_time(fastest_time) if fastest_time else 'N/A'}
+Slowest Solve: {format_solve_time(slowest_time) if slowest_time else 'N/A'}
+Used Hints: {cheated_count} puzzles
+"""
+
+    return result.strip()
+
+def _format_recent(days: int, solves: list[Solve]) -> str:
+    """Format a most-recent-first listing of solve records."""
+    # Sort by date (most recent first)
+    ordered = sorted(solves, key=attrgetter('date'), reverse=True)
+
+    # Build the output with join rather than repeated string concatenation
+    parts = [f"Recent Solves (Last {days} days):\n\n"]
+
+    for solve in ordered:
+        cheat_indicator = " (used hints)" if solve.cheated else ""
+        parts.append(f"Date: {solve.date}\n")
+        parts.append(f"Solve Time: {format_solve_time(solve.solve_time)}{cheat_indicator}\n---\n")
+
+    return "".join(parts).strip()
+
+
 @mcp.tool()
 async def get_solve_stats(days: int = 30) -> str:
     """Get crossword solving statistics by analyzing recent solves.
-    
+
     Args:
         days: Number of recent days to analyze (default: 30, max: 90)
-    
+
     Returns summary statistics calculated from your recent solving history.
     """
     if not config.nyt_cookie:
         return "NYT cookie not configured. Set the NYT_COOKIE environment variable."
-    
+
     if days < 1 or days > 90:
         return "Days must be between 1 and 90"
-    
-    # Calculate date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-    
-    start_date_str = start_date.strftime("%Y-%m-%d")
-    end_date_str = end_date.strftime("%Y-%m-%d")
-    
-    # Get puzzle IDs for the date range
-    puzzle_ids = await get_puzzle_ids(start_date_str, end_date_str)
-    if not puzzle_ids:
+
+    loaded = await _load_solves(days)
+    if loaded is None:
         return f"Unable to fetch puzzle information for the last {days} days."
-    
-    solved_puzzles = []
-    total_puzzles = len(puzzle_ids)
-    
-    for date_str, puzzle_id in puzzle_ids.items():
-        puzzle_stats = await get_puzzle_solve_stats(puzzle_id)
-        if puzzle_stats:
-            calcs = puzzle_stats.get('calcs', {})
-            if calcs.get('solved'):
-                solve_time = calcs.get('secondsSpentSolving', 0)
-                firsts = puzzle_stats.get('firsts', {})
-                cheated = bool(firsts.get('checked') or firsts.get('revealed'))
-                
-                solved_puzzles.append({
-                    'date': date_str,
-                    'solve_time': solve_time,
-                    'cheated': cheated
-                })
-    
-    if not solved_puzzles:
+
+    total_puzzles, solves = loaded
+    if not solves:
         return f"No solved puzzles found in the last {days} days."
-    
-    # Calculate statistics
-    total_solved = len(solved_puzzles)
-    solve_times = [p['solve_time'] for p in solved_puzzles if p['solve_time'] > 0]
-    avg_time = sum(solve_times) // len(solve_times) if solve_times else 0
-    fastest_time = min(solve_times) if solve_times else 0
-    slowest_time = max(solve_times) if solve_times else 0
-    cheated_count = sum(1 for p in solved_puzzles if p['cheated'])
-    
-    result = f"""
-Your NYT Crossword Statistics (Last {days} days):
 
-Puzzles Available: {total_puzzles}
-Puzzles Solved: {total_solved}
-Solve Rate: {(total_solved/total_puzzles*100):.1f}%
-Average Solve Time: {format_solve_time(avg_time) if avg_time else 'N/A'}
-Fastest Solve: {format_solve_time(fastest_time) if fastest_time else 'N/A'}
-Slowest Solve: {format_solve_time(slowest_time) if slowest_time else 'N/A'}
-Used Hints: {cheated_count} puzzles
-"""
-    
-    return result.strip()
+    return _format_stats(days, total_puzzles, solves)
 
 @mcp.tool()
 async def get_recent_solves(days: int = 7) -> str:
@@ -190,50 +592,43 @@ async def get_recent_solves(days: int = 7) -> str:
     
     if days < 1 or days > 30:
         return "Days must be between 1 and 30"
-    
-    # Calculate date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-    
-    start_date_str = start_date.strftime("%Y-%m-%d")
-    end_date_str = end_date.strftime("%Y-%m-%d")
-    
-    # Get puzzle IDs for the date range
-    puzzle_ids = await get_puzzle_ids(start_date_str, end_date_str)
-    if not puzzle_ids:
+
+    loaded = await _load_solves(days)
+    if loaded is None:
         return f"Unable to fetch puzzle information for the last {days} days."
-    
-    solves = []
-    for date_str, puzzle_id in puzzle_ids.items():
-        puzzle_stats = await get_puzzle_solve_stats(puzzle_id)
-        if puzzle_stats:
-            # Check if puzzle was solved
-            calcs = puzzle_stats.get('calcs', {})
-            if calcs.get('solved'):
-                solve_time = calcs.get('secondsSpentSolving', 0)
-                firsts = puzzle_stats.get('firsts', {})
-                cheated = bool(firsts.get('checked') or firsts.get('revealed'))
-                
-                solves.append({
-                    'date': date_str,
-                    'solve_time': solve_time,
-                    'cheated': cheated
-                })
-    
+
+    _, solves = loaded
     if not solves:
         return f"No solved puzzles found for the last {days} days."
-    
-    # Sort by date (most recent first)
-    solves.sort(key=lambda x: x['date'], reverse=True)
-    
-    result = f"Recent Solves (Last {days} days):\n\n"
-    
-    for solve in solves:
-        cheat_indicator = " (used hints)" if solve['cheated'] else ""
-        result += f"Date: {solve['date']}\n"
-        result += f"Solve Time: {format_solve_time(solve['solve_time'])}{cheat_indicator}\n---\n"
-    
-    return result.strip()
+
+    return _format_recent(days, solves)
+
+@mcp.tool()
+async def get_dashboard(days: int = 7) -> str:
+    """Get solving statistics and recent solve times in a single call.
+
+    Fetches each puzzle once and renders both views from the shared
+    data, instead of the client calling get_solve_stats and
+    get_recent_solves back to back.
+
+    Args:
+        days: Number of recent days to cover (default: 7, max: 90)
+    """
+    if not config.nyt_cookie:
+        return "NYT cookie not configured. Set the NYT_COOKIE environment variable."
+
+    if days < 1 or days > 90:
+        return "Days must be between 1 and 90"
+
+    loaded = await _load_solves(days)
+    if loaded is None:
+        return f"Unable to fetch puzzle information for the last {days} days."
+
+    total_puzzles, solves = loaded
+    if not solves:
+        return f"No solved puzzles found in the last {days} days."
+
+    return f"{_format_stats(days, total_puzzles, solves)}\n\n{_format_recent(days, solves)}"
 
 @mcp.tool()
 async def get_puzzle_details(date: str) -> str:
@@ -246,17 +641,16 @@ async def get_puzzle_details(date: str) -> str:
         return "NYT cookie not configured. Set the NYT_COOKIE environment variable."
     
     try:
-        datetime.strptime(date, "%Y-%m-%d")
+        date_cls.fromisoformat(date)
     except ValueError:
         return "Invalid date format. Please use YYYY-MM-DD (e.g., '2024-01-15')"
     
     # Get puzzle ID for the specific date
-    puzzle_ids = await get_puzzle_ids(date, date)
-    if not puzzle_ids or date not in puzzle_ids:
+    puzzle_id = await lookup_puzzle_id(date)
+    if puzzle_id is None:
         return f"No puzzle found for {date}"
-    
-    puzzle_id = puzzle_ids[date]
-    puzzle_stats = await get_puzzle_solve_stats(puzzle_id)
+
+    puzzle_stats = await get_puzzle_solve_stats(puzzle_id, date)
     
     if not puzzle_stats:
         return f"Unable to fetch puzzle stats for {date}"
@@ -267,25 +661,25 @@ async def get_puzzle_details(date: str) -> str:
     
     solved = calcs.get('solved', False)
     solve_time = calcs.get('secondsSpentSolving', 0) if solved else 0
-    cheated = bool(firsts.get('checked') or firsts.get('revealed')) if solved else False
-    
-    result = f"Puzzle Details for {date}:\n\n"
-    result += f"Puzzle ID: {puzzle_id}\n"
-    result += f"Status: {'Solved' if solved else 'Not solved'}\n"
+    cheated = not _CHEAT_KEYS.isdisjoint(firsts) if solved else False
     
+    parts = [f"Puzzle Details for {date}:\n\n"]
+    parts.append(f"Puzzle ID: {puzzle_id}\n")
+    parts.append(f"Status: {'Solved' if solved else 'Not solved'}\n")
+
     if solved:
         cheat_indicator = " (used hints)" if cheated else ""
-        result += f"Solve Time: {format_solve_time(solve_time)}{cheat_indicator}\n"
-        
+        parts.append(f"Solve Time: {format_solve_time(solve_time)}{cheat_indicator}\n")
+
         if firsts.get('opened'):
             opened_time = firsts['opened']
-            result += f"First Opened: {datetime.fromtimestamp(opened_time).strftime('%Y-%m-%d %H:%M:%S')}\n"
-        
+            parts.append(f"First Opened: {datetime.fromtimestamp(opened_time).isoformat(' ', 'seconds')}\n")
+
         if firsts.get('solved'):
             solved_time = firsts['solved']
-            result += f"Completed: {datetime.fromtimestamp(solved_time).strftime('%Y-%m-%d %H:%M:%S')}\n"
-    
-    return result.strip()
+            parts.append(f"Completed: {datetime.fromtimestamp(solved_time).isoformat(' ', 'seconds')}\n")
+
+    return "".join(parts).strip()
 
 
 if __name__ == "__main__":